@@ -1,9 +1,89 @@
 import os
+import re
+import shlex
+import shutil
+import stat
 import subprocess
 import sys
-from typing import List, Dict, Optional
+from types import MappingProxyType
+from typing import List, Dict, Optional, Set
 
-import streamlit as st
+# Streamlit is imported in main() so that importing this module stays cheap
+st = None
+
+_REPO_RE = re.compile(r'^(https://github\.com/|git@github\.com:)[^/]+/[^/]+\.git$')
+
+_INSTALL_GUIDES = MappingProxyType({
+    'Windows': 'https://git-scm.com/download/win',
+    'macOS': 'https://git-scm.com/download/mac',
+    'Linux': 'sudo apt-get install git'
+})
+
+_PREDEFINED_IGNORES = MappingProxyType({
+    'Node.js': ('node_modules/', '*.log', '.DS_Store'),
+    'Python': ('*.pyc', '__pycache__/', '.venv/', 'venv/'),
+    'Java': ('*.class', 'target/', 'build/'),
+    'IDE': ('.idea/', '.vscode/', '*.sublime-project'),
+    'Temp Files': ('*.swp', '*.swo', '*~')
+})
+
+class _GitWorker:
+    """
+    Cache global Git configuration from a single 'git config --list' call.
+    """
+    def __init__(self):
+        self._config: Optional[Dict[str, str]] = None
+
+    def _load(self) -> Dict[str, str]:
+        """
+        Read the whole global Git configuration in one subprocess.
+        
+        Returns:
+            Dict[str, str]: Configuration keys mapped to their values
+        """
+        result = subprocess.run(
+            ['git', '--no-pager', 'config', '--global', '--list'],
+            capture_output=True,
+            text=True
+        )
+        config = {}
+        if result.returncode == 0:
+            for line in result.stdout.splitlines():
+                key, sep, value = line.partition('=')
+                if sep:
+                    config[key.strip().lower()] = value.strip()
+        return config
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a global Git configuration value.
+        
+        Args:
+            key (str): Configuration key, e.g. 'user.name'
+        
+        Returns:
+            Optional[str]: Configured value or None if unset
+        """
+        if self._config is None:
+            self._config = self._load()
+        return self._config.get(key.lower())
+
+    def invalidate(self):
+        """
+        Drop the cached configuration so the next lookup re-reads it.
+        """
+        self._config = None
+
+def _get_git_worker() -> _GitWorker:
+    """
+    Return the Git config worker shared across Streamlit reruns.
+    
+    Returns:
+        _GitWorker: Session-scoped worker instance
+    """
+    if 'git_worker' not in st.session_state:
+        st.session_state.git_worker = _GitWorker()
+    return st.session_state.git_worker
 
 class GitHubSetup:
     def __init__(self):
@@ -14,32 +94,54 @@ class GitHubSetup:
             'repository_url': '',
             'commit_message': ''
         }
-        self.ignored_files: List[str] = []
+        self.ignored_files: Set[str] = set()
 
-    def run_shell_command(self, command: str) -> bool:
+    def run_shell_command(self, *commands: List[str], capture_output: bool = True) -> bool:
         """
-        Execute a shell command and handle its output and errors.
+        Execute commands directly (without a shell) and handle their output and errors.
         
         Args:
-            command (str): Shell command to execute
+            *commands (List[str]): Argument vectors to execute in order; like
+                '&&', execution stops at the first failing command
+            capture_output (bool): Capture and display stdout; when False,
+                stdout is discarded and only stderr is decoded on failure
         
         Returns:
-            bool: True if command successful, False otherwise
+            bool: True if all commands successful, False otherwise
         """
-        try:
-            result = subprocess.run(
-                command, 
-                shell=True, 
-                check=True, 
-                capture_output=True, 
-                text=True
-            )
-            st.success(result.stdout)
-            return True
-        except subprocess.CalledProcessError as error:
-            st.error(f"Command Execution Error: {error}")
-            st.error(error.stderr)
-            return False
+        for argv in commands:
+            try:
+                if capture_output:
+                    result = subprocess.run(
+                        argv, 
+                        capture_output=True, 
+                        text=True
+                    )
+                else:
+                    result = subprocess.run(
+                        argv, 
+                        stdout=subprocess.DEVNULL, 
+                        stderr=subprocess.PIPE
+                    )
+            except OSError as error:
+                st.error(f"Command Execution Error: {error}")
+                return False
+            
+            if result.returncode != 0:
+                st.error(
+                    f"Command Execution Error: Command '{shlex.join(argv)}' "
+                    f"returned non-zero exit status {result.returncode}."
+                )
+                stderr = result.stderr or result.stdout
+                if isinstance(stderr, bytes):
+                    stderr = stderr.decode(errors='replace')
+                if stderr:
+                    st.error(stderr)
+                return False
+            
+            if capture_output:
+                st.success(result.stdout)
+        return True
 
     def validate_git_installation(self) -> bool:
         """
@@ -48,31 +150,25 @@ class GitHubSetup:
         Returns:
             bool: True if Git is installed, False otherwise
         """
-        try:
-            subprocess.run(
-                ["git", "--version"], 
-                capture_output=True, 
-                text=True
-            )
+        if 'git_installed' not in st.session_state:
+            st.session_state.git_installed = shutil.which("git") is not None
+        
+        if st.session_state.git_installed:
             st.success("Git is already installed.")
+            if st.checkbox("Show Git version"):
+                self.run_shell_command(["git", "--version"])
             return True
-        except FileNotFoundError:
-            st.warning("Git is not installed.")
-            self.provide_git_installation_guidance()
-            return False
+        
+        st.warning("Git is not installed.")
+        self.provide_git_installation_guidance()
+        return False
 
     def provide_git_installation_guidance(self):
         """
         Provide installation instructions for Git across different platforms.
         """
-        installation_guides = {
-            'Windows': 'https://git-scm.com/download/win',
-            'macOS': 'https://git-scm.com/download/mac',
-            'Linux': 'sudo apt-get install git'
-        }
-        
         st.info("--- Git Installation Guide ---")
-        for platform, link in installation_guides.items():
+        for platform, link in _INSTALL_GUIDES.items():
             st.write(f"{platform}: {link}")
 
     def select_project_directory(self) -> bool:
@@ -90,7 +186,12 @@ class GitHubSetup:
         if directory_input:
             directory_path = directory_input.strip()
             
-            if os.path.exists(directory_path) and os.path.isdir(directory_path):
+            try:
+                is_directory = stat.S_ISDIR(os.stat(directory_path).st_mode)
+            except (OSError, ValueError):
+                is_directory = False
+            
+            if is_directory:
                 try:
                     os.chdir(directory_path)
                     self.project_directory = directory_path
@@ -100,9 +201,36 @@ class GitHubSetup:
                     st.error(f"Error changing directory: {e}")
             else:
                 st.error("Invalid directory. Please check the path and try again.")
+                suggestions = self.complete_directory_path(directory_path)
+                if suggestions:
+                    st.info("Did you mean: " + ", ".join(suggestions))
         
         return False
 
+    def complete_directory_path(self, partial_path: str, limit: int = 10) -> List[str]:
+        """
+        Suggest existing directories that start with a partially typed path.
+        
+        Args:
+            partial_path (str): Path typed so far
+            limit (int): Maximum number of suggestions
+        
+        Returns:
+            List[str]: Matching directory paths, sorted
+        """
+        parent, prefix = os.path.split(partial_path)
+        try:
+            # scandir exposes the entry type without an extra stat per candidate
+            with os.scandir(parent or os.curdir) as entries:
+                matches = [
+                    os.path.join(parent, entry.name)
+                    for entry in entries
+                    if entry.name.startswith(prefix) and entry.is_dir()
+                ]
+        except (OSError, ValueError):
+            return []
+        return sorted(matches)[:limit]
+
     def check_existing_git_config(self) -> Optional[dict]:
         """
         Check existing Git configuration.
@@ -111,21 +239,14 @@ class GitHubSetup:
             Optional[dict]: Existing Git configuration or None
         """
         try:
-            username_cmd = subprocess.run(
-                ['git', 'config', '--global', 'user.name'], 
-                capture_output=True, 
-                text=True
-            )
-            email_cmd = subprocess.run(
-                ['git', 'config', '--global', 'user.email'], 
-                capture_output=True, 
-                text=True
-            )
+            worker = _get_git_worker()
+            username = worker.get('user.name')
+            email = worker.get('user.email')
             
-            if username_cmd.returncode == 0 and email_cmd.returncode == 0:
+            if username and email:
                 existing_config = {
-                    'username': username_cmd.stdout.strip(),
-                    'email': email_cmd.stdout.strip()
+                    'username': username,
+                    'email': email
                 }
                 return existing_config
             return None
@@ -139,7 +260,20 @@ class GitHubSetup:
         """
         st.header("Git Credentials Configuration")
         
-        existing_config = self.check_existing_git_config()
+        if st.button("Check Existing Configuration"):
+            st.session_state.show_existing = True
+        
+        if st.button("Refresh Git Configuration"):
+            st.session_state.pop('git_installed', None)
+            st.session_state.pop('existing_cfg', None)
+            _get_git_worker().invalidate()
+        
+        # Only look up the existing configuration once the user asks for it
+        existing_config = None
+        if st.session_state.get('show_existing'):
+            if 'existing_cfg' not in st.session_state:
+                st.session_state.existing_cfg = self.check_existing_git_config()
+            existing_config = st.session_state.existing_cfg
         
         if existing_config:
             st.info(f"Current Username: {existing_config['username']}")
@@ -165,11 +299,15 @@ class GitHubSetup:
         
         if st.button("Configure Git Credentials"):
             if new_username and new_email:
-                username_cmd = f'git config --global user.name "{new_username}"'
-                email_cmd = f'git config --global user.email "{new_email}"'
+                configured = self.run_shell_command(
+                    ['git', 'config', '--global', 'user.name', new_username],
+                    ['git', 'config', '--global', 'user.email', new_email],
+                    capture_output=False
+                )
+                st.session_state.pop('existing_cfg', None)
+                _get_git_worker().invalidate()
                 
-                if (self.run_shell_command(username_cmd) and 
-                    self.run_shell_command(email_cmd)):
+                if configured:
                     st.success("Git credentials configured successfully!")
                 else:
                     st.error("Configuration failed.")
@@ -182,17 +320,9 @@ class GitHubSetup:
         """
         st.header(".gitignore Configuration")
         
-        predefined_ignores = {
-            'Node.js': ['node_modules/', '*.log', '.DS_Store'],
-            'Python': ['*.pyc', '__pycache__/', '.venv/', 'venv/'],
-            'Java': ['*.class', 'target/', 'build/'],
-            'IDE': ['.idea/', '.vscode/', '*.sublime-project'],
-            'Temp Files': ['*.swp', '*.swo', '*~']
-        }
-
         selected_templates = st.multiselect(
             "Select predefined .gitignore templates",
-            list(predefined_ignores.keys())
+            list(_PREDEFINED_IGNORES.keys())
         )
 
         custom_ignores = st.text_area(
@@ -201,23 +331,29 @@ class GitHubSetup:
         )
 
         if st.button("Create .gitignore"):
-            self.ignored_files = []
-            
             # Add selected templates
-            for template in selected_templates:
-                self.ignored_files.extend(predefined_ignores[template])
+            self.ignored_files = {
+                entry
+                for template in selected_templates
+                for entry in _PREDEFINED_IGNORES.get(template, ())
+            }
             
             # Add custom ignores
             if custom_ignores:
-                custom_list = [i.strip() for i in custom_ignores.split(',') if i.strip()]
-                self.ignored_files.extend(custom_list)
+                self.ignored_files.update(
+                    entry for entry in map(str.strip, custom_ignores.split(',')) if entry
+                )
 
+            # Sorted output keeps the generated file stable across runs
+            entries = sorted(self.ignored_files)
+            
             try:
                 with open('.gitignore', 'w') as gitignore_file:
-                    for entry in set(self.ignored_files):
-                        gitignore_file.write(f"{entry}\n")
+                    gitignore_file.write("\n".join(entries))
+                    if entries:
+                        gitignore_file.write("\n")
                 st.success("✅ .gitignore file created successfully!")
-                st.write("Ignored files:", ", ".join(set(self.ignored_files)))
+                st.write("Ignored files:", ", ".join(entries))
             except IOError as error:
                 st.error(f"❌ .gitignore creation error: {error}")
 
@@ -231,12 +367,12 @@ class GitHubSetup:
         
         if st.button("Stage and Commit"):
             if commit_message:
-                staging_result = self.run_shell_command("git add .")
-                commit_result = self.run_shell_command(
-                    f'git commit -m "{commit_message}"'
+                commit_result = (
+                    self.run_shell_command(["git", "add", "."], capture_output=False) and
+                    self.run_shell_command(["git", "commit", "-m", commit_message])
                 )
                 
-                if staging_result and commit_result:
+                if commit_result:
                     st.success("✅ Changes staged and committed!")
                 else:
                     st.error("❌ Staging or commit failed.")
@@ -250,7 +386,7 @@ class GitHubSetup:
         st.header("Initialize Local Repository")
         
         if st.button("Initialize Git Repository"):
-            if self.run_shell_command("git init"):
+            if self.run_shell_command(["git", "init"], capture_output=False):
                 st.success("✅ Local Git repository initialized!")
             else:
                 st.error("❌ Repository initialization failed.")
@@ -267,10 +403,10 @@ class GitHubSetup:
         )
         
         if st.button("Link Remote Repository"):
-            if repo_url.startswith(('https://github.com/', 'git@github.com:')) and repo_url.endswith('.git'):
+            if _REPO_RE.match(repo_url):
                 self.git_config['repository_url'] = repo_url
                 
-                if self.run_shell_command(f'git remote add origin {repo_url}'):
+                if self.run_shell_command(["git", "remote", "add", "origin", repo_url]):
                     st.success("✅ Remote repository linked successfully!")
                 else:
                     st.error("❌ Failed to link repository. Check URL and Git configuration.")
@@ -284,10 +420,12 @@ class GitHubSetup:
         st.header("Push to GitHub")
         
         if st.button("Push to GitHub"):
-            branch_rename_result = self.run_shell_command("git branch -M main")
-            push_result = self.run_shell_command("git push -u origin main")
+            push_result = (
+                self.run_shell_command(["git", "branch", "-M", "main"], capture_output=False) and
+                self.run_shell_command(["git", "push", "-u", "origin", "main"])
+            )
             
-            if branch_rename_result and push_result:
+            if push_result:
                 st.success("✅ Code pushed to GitHub!")
             else:
                 st.error("❌ GitHub push failed.")
@@ -296,6 +434,9 @@ def main():
     """
     Streamlit app main function.
     """
+    global st
+    import streamlit as st
+    
     st.title("🚀 Git & GitHub Setup Wizard")
     
     # Initialize GitHubSetup